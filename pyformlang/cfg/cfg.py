@@ -1,6 +1,6 @@
 """ A context free grammar """
-import string
-from copy import deepcopy
+import re
+from itertools import chain, product
 from typing import AbstractSet, Iterable, Tuple, Dict, Any
 
 import networkx as nx
@@ -11,7 +11,7 @@ from pyformlang.finite_automaton import FiniteAutomaton
 # pylint: disable=cyclic-import
 from pyformlang.pda import cfg_variable_converter as cvc
 from pyformlang import regular_expression
-from .cfg_object import CFGObject
+from .cfg_object import CFGObject, VARIABLE_KIND, EPSILON_KIND
 # pylint: disable=cyclic-import
 from .cyk_table import CYKTable, DerivationDoesNotExist
 from .epsilon import Epsilon
@@ -26,6 +26,11 @@ EPSILON_SYMBOLS = ["epsilon", "$", "ε", "ϵ", "Є"]
 
 SUBS_SUFFIX = "#SUBS#"
 
+_EPSILON = Epsilon()
+
+# A symbol in the bodies of a line, or the separator of two bodies
+_BODY_TOKEN = re.compile(r"[^\s|]+|\|")
+
 
 class NotParsableException(Exception):
     """When the grammar cannot be parsed (parser not powerful enough)"""
@@ -74,22 +79,51 @@ class CFG:
             self._variables.add(start_symbol)
         self._productions = productions or set()
         self._productions = self._productions
-        for production in self._productions:
-            self.__initialize_production_in_cfg(production)
+        self._variables.update(production.head
+                               for production in self._productions)
+        body_symbols = [symbol
+                        for production in self._productions
+                        for symbol in production.body]
+        # The symbols which are not CFG objects are kept as variables
+        kinds = [getattr(symbol, "kind", VARIABLE_KIND)
+                 for symbol in body_symbols]
+        self._terminals.update(symbol
+                               for symbol, kind in zip(body_symbols, kinds)
+                               if kind != VARIABLE_KIND)
+        self._variables.update(symbol
+                               for symbol, kind in zip(body_symbols, kinds)
+                               if kind == VARIABLE_KIND)
         self._normal_form = None
         self._generating_symbols = None
         self._nullable_symbols = None
+        self._reachable_symbols = None
+        self._productions_by_head = None
+        self._productions_by_body = None
         self._impacts = None
         self._remaining_lists = None
         self._added_impacts = None
+        self._production_heads = None
 
-    def __initialize_production_in_cfg(self, production):
-        self._variables.add(production.head)
-        for cfg_object in production.body:
-            if isinstance(cfg_object, Terminal):
-                self._terminals.add(cfg_object)
-            else:
-                self._variables.add(cfg_object)
+    @classmethod
+    def _from_internals(cls, variables, terminals, start_symbol, productions,
+                        *, generating=None, reachable=None, nullable=None):
+        """ Creates a CFG without scanning its productions
+
+        The variables and the terminals must already contain the start \
+        symbol and all the symbols of the productions. The generating, \
+        reachable and nullable symbols are kept as already computed when \
+        given.
+        """
+        # pylint: disable=protected-access, too-many-arguments
+        new_cfg = cls()
+        new_cfg._variables = variables
+        new_cfg._terminals = terminals
+        new_cfg._start_symbol = start_symbol
+        new_cfg._productions = productions
+        new_cfg._generating_symbols = generating
+        new_cfg._reachable_symbols = reachable
+        new_cfg._nullable_symbols = nullable
+        return new_cfg
 
     def get_generating_symbols(self) -> AbstractSet[CFGObject]:
         """ Gives the objects which are generating in the CFG
@@ -103,59 +137,58 @@ class CFG:
             self._generating_symbols = self._get_generating_or_nullable(False)
         return self._generating_symbols
 
-    def _get_generating_or_nullable(self, nullable=False):
-        """ Merge of nullable and generating """
-        to_process = [Epsilon()]
-        g_symbols = {Epsilon()}
+    def _get_generating_or_nullable(self, nullable=False, stop_on=None):
+        """ Merge of nullable and generating
 
+        The search stops as soon as stop_on is found, the returned set is
+        then partial """
         self._set_impacts_and_remaining_lists()
-
-        for symbol in self._added_impacts:
-            if symbol not in g_symbols:
-                g_symbols.add(symbol)
-                to_process.append(symbol)
-
+        g_symbols = {_EPSILON}
+        g_symbols.update(self._added_impacts)
         if not nullable:
-            for terminal in self._terminals:
-                g_symbols.add(terminal)
-                to_process.append(terminal)
-
-        processed_with_modification = []
-        while to_process:
+            g_symbols.update(self._terminals)
+        to_process = list(g_symbols)
+
+        # A symbol is pushed only when it joins g_symbols, so each symbol is
+        # processed at most once and each count is decremented at most once
+        # per occurrence in a body
+        remaining = list(self._remaining_lists)
+        heads = self._production_heads
+        impacts = self._impacts
+        while to_process and stop_on not in g_symbols:
             current = to_process.pop()
-            for symbol_impact, index_impact in self._impacts.get(current, []):
-                if symbol_impact in g_symbols:
-                    continue
-                processed_with_modification.append(
-                    (symbol_impact, index_impact))
-                self._remaining_lists[symbol_impact][index_impact] -= 1
-                if self._remaining_lists[symbol_impact][index_impact] == 0:
-                    g_symbols.add(symbol_impact)
-                    to_process.append(symbol_impact)
-        # Fix modifications
-        for symbol_impact, index_impact in processed_with_modification:
-            self._remaining_lists[symbol_impact][index_impact] += 1
-        g_symbols.remove(Epsilon())
+            for index_impact in impacts.get(current, ()):
+                remaining[index_impact] -= 1
+                if remaining[index_impact] == 0:
+                    head = heads[index_impact]
+                    if head not in g_symbols:
+                        g_symbols.add(head)
+                        to_process.append(head)
+        g_symbols.remove(_EPSILON)
         return g_symbols
 
     def _set_impacts_and_remaining_lists(self):
+        """ Indexes the productions with a non-empty body
+
+        The remaining list holds the length of each body, the impacts map
+        each symbol to the indexes of the bodies it appears in """
         if self._impacts is not None:
             return
         self._added_impacts = set()
-        self._remaining_lists = dict()
-        self._impacts = dict()
+        self._remaining_lists = []
+        self._production_heads = []
+        self._impacts = {}
         for production in self._productions:
             head = production.head  # Should check if head is not Epsilon?
             body = production.body
             if not body:
                 self._added_impacts.add(head)
                 continue
-            temp = self._remaining_lists.setdefault(head, [])
-            temp.append(len(body))
-            index_impact = len(temp) - 1
+            index_impact = len(self._remaining_lists)
+            self._remaining_lists.append(len(body))
+            self._production_heads.append(head)
             for symbol in body:
-                self._impacts.setdefault(symbol, []).append(
-                    (head, index_impact))
+                self._impacts.setdefault(symbol, []).append(index_impact)
 
     def generate_epsilon(self):
         """ Whether the grammar generates epsilon or not
@@ -165,32 +198,31 @@ class CFG:
         generate_epsilon : bool
             Whether epsilon is generated or not by the CFG
         """
-        generate_epsilon = {Epsilon()}
-        to_process = [Epsilon()]
-
         self._set_impacts_and_remaining_lists()
-
-        for symbol in self._added_impacts:
-            if symbol == self._start_symbol:
-                return True
-            if symbol not in generate_epsilon:
-                generate_epsilon.add(symbol)
-                to_process.append(symbol)
-        remaining_lists = self._remaining_lists
+        if self._start_symbol in self._added_impacts:
+            return True
+        # Only the symbols reachable from the start symbol can make it
+        # nullable
+        relevant = self.get_reachable_symbols()
+        generate_epsilon = {_EPSILON}
+        generate_epsilon.update(self._added_impacts.intersection(relevant))
+        to_process = list(generate_epsilon)
+
+        remaining = list(self._remaining_lists)
+        heads = self._production_heads
         impacts = self._impacts
-        remaining_lists = deepcopy(remaining_lists)
-
         while to_process:
             current = to_process.pop()
-            for symbol_impact, index_impact in impacts.get(current, []):
-                if symbol_impact in generate_epsilon:
-                    continue
-                remaining_lists[symbol_impact][index_impact] -= 1
-                if remaining_lists[symbol_impact][index_impact] == 0:
-                    if symbol_impact == self._start_symbol:
+            for index_impact in impacts.get(current, ()):
+                remaining[index_impact] -= 1
+                if remaining[index_impact] == 0:
+                    head = heads[index_impact]
+                    if head in generate_epsilon or head not in relevant:
+                        continue
+                    if head == self._start_symbol:
                         return True
-                    generate_epsilon.add(symbol_impact)
-                    to_process.append(symbol_impact)
+                    generate_epsilon.add(head)
+                    to_process.append(head)
         return False
 
     def get_reachable_symbols(self) -> AbstractSet[CFGObject]:
@@ -201,23 +233,41 @@ class CFG:
         reachable_symbols : set of :class:`~pyformlang.cfg.CFGObject`
             The reachable symbols of the CFG
         """
-        r_symbols = set()
-        r_symbols.add(self._start_symbol)
-        reachable_transition_d = dict()
+        if self._reachable_symbols is None:
+            self._reachable_symbols = self._get_reachable_symbols()
+        return self._reachable_symbols
+
+    def _get_reachable_symbols(self):
+        successors = dict()
         for production in self._productions:
-            temp = reachable_transition_d.setdefault(production.head, [])
-            for symbol in production.body:
-                if not isinstance(symbol, Epsilon):
-                    temp.append(symbol)
+            successors.setdefault(production.head, []).extend(
+                symbol for symbol in production.body
+                if symbol.kind != EPSILON_KIND)
+        r_symbols = {self._start_symbol}
         to_process = [self._start_symbol]
         while to_process:
             current = to_process.pop()
-            for next_symbol in reachable_transition_d.get(current, []):
-                if next_symbol not in r_symbols:
-                    r_symbols.add(next_symbol)
-                    to_process.append(next_symbol)
+            for symbol in successors.get(current, ()):
+                if symbol not in r_symbols:
+                    r_symbols.add(symbol)
+                    to_process.append(symbol)
         return r_symbols
 
+    def _get_productions_by_head(self):
+        """ The productions of each head, not to be modified """
+        if self._productions_by_head is None:
+            self._productions_by_head = get_productions_d(self._productions)
+        return self._productions_by_head
+
+    def _get_productions_by_body(self):
+        """ The heads of the productions of each body, not to be modified """
+        if self._productions_by_body is None:
+            self._productions_by_body = dict()
+            for production in self._productions:
+                self._productions_by_body.setdefault(
+                    production.body, []).append(production.head)
+        return self._productions_by_body
+
     def remove_useless_symbols(self) -> "CFG":
         """ Removes useless symbols in a CFG
 
@@ -227,18 +277,40 @@ class CFG:
             The CFG without useless symbols
         """
         generating = self.get_generating_symbols()
-        productions = [x for x in self._productions
-                       if x.head in generating and
-                       all([y in generating for y in x.body])]
-        new_var = self._variables.intersection(generating)
-        new_ter = self._terminals.intersection(generating)
-        cfg_temp = CFG(new_var, new_ter, self._start_symbol, productions)
-        reachables = cfg_temp.get_reachable_symbols()
-        productions = [x for x in productions
-                       if x.head in reachables]
-        new_var = new_var.intersection(reachables)
-        new_ter = new_ter.intersection(reachables)
-        return CFG(new_var, new_ter, self._start_symbol, productions)
+        if self._variables.issubset(generating) and \
+                self._terminals.issubset(generating):
+            # Nothing to filter, the productions can be shared
+            productions = self._productions
+            variables = self._variables
+            terminals = self._terminals
+            reachables = self.get_reachable_symbols()
+        else:
+            is_generating = generating.__contains__
+            productions = [x for x in self._productions
+                           if is_generating(x.head) and
+                           all(map(is_generating, x.body))]
+            variables = self._variables.intersection(generating)
+            if self._start_symbol is not None:
+                variables.add(self._start_symbol)
+            terminals = self._terminals.intersection(generating)
+            reachables = CFG._from_internals(
+                variables, terminals, self._start_symbol, productions,
+                generating=generating).get_reachable_symbols()
+        if variables.issubset(reachables) and terminals.issubset(reachables):
+            variables = set(variables)
+            terminals = set(terminals)
+        else:
+            productions = [x for x in productions
+                           if x.head in reachables]
+            variables = variables.intersection(reachables)
+            terminals = terminals.intersection(reachables)
+        # The removal of unreachable symbols does not change which symbols
+        # are generating, and the remaining ones stay reachable
+        return CFG._from_internals(variables, terminals, self._start_symbol,
+                                   productions,
+                                   generating=generating.intersection(
+                                       reachables),
+                                   reachable=reachables)
 
     def get_nullable_symbols(self) -> AbstractSet[CFGObject]:
         """ Gives the objects which are nullable in the CFG
@@ -265,10 +337,13 @@ class CFG:
         for production in self._productions:
             new_productions += remove_nullable_production(production,
                                                           nullables)
-        return CFG(self._variables,
-                   self._terminals,
-                   self._start_symbol,
-                   new_productions)
+        # Only empty bodies are removed, so all the symbols stay reachable
+        return CFG._from_internals(set(self._variables),
+                                   set(self._terminals),
+                                   self._start_symbol,
+                                   new_productions,
+                                   reachable=self._reachable_symbols,
+                                   nullable=set())
 
     def get_unit_pairs(self) -> AbstractSet[Tuple[Variable, Variable]]:
         """ Finds all the unit pairs
@@ -278,21 +353,34 @@ class CFG:
         unit_pairs : set of tuple of :class:`~pyformlang.cfg.Variable`
             The unit pairs
         """
+        unit_graph = nx.DiGraph()
+        unit_graph.add_nodes_from(self._variables)
+        unit_graph.add_edges_from((x.head, x.body[0])
+                                  for x in self._productions
+                                  if len(x.body) == 1
+                                  and x.body[0].kind == VARIABLE_KIND)
+        # The variables of a strongly connected component share their unit
+        # successors. The components reachable from each component are
+        # stored as bits of an integer, so a whole row of the closure is
+        # merged with a single or.
+        condensation = nx.condensation(unit_graph)
+        reachable_components = dict()
+        for component in reversed(list(nx.topological_sort(condensation))):
+            reachable = 1 << component
+            for successor in condensation.successors(component):
+                reachable |= reachable_components[successor]
+            reachable_components[component] = reachable
         unit_pairs = set()
-        for variable in self._variables:
-            unit_pairs.add((variable, variable))
-        productions = [x
-                       for x in self._productions
-                       if len(x.body) == 1 and isinstance(x.body[0], Variable)]
-        productions_d = get_productions_d(productions)
-        to_process = list(unit_pairs)
-        while to_process:
-            var_a, var_b = to_process.pop()
-            for production in productions_d.get(var_b, []):
-                temp = (var_a, production.body[0])
-                if temp not in unit_pairs:
-                    unit_pairs.add(temp)
-                    to_process.append(temp)
+        for component, reachable in reachable_components.items():
+            reachable_variables = []
+            while reachable:
+                lowest = reachable & -reachable
+                reachable_variables.extend(
+                    condensation.nodes[lowest.bit_length() - 1]["members"])
+                reachable ^= lowest
+            for var_a in condensation.nodes[component]["members"]:
+                unit_pairs.update((var_a, var_b)
+                                  for var_b in reachable_variables)
         return unit_pairs
 
     def eliminate_unit_productions(self) -> "CFG":
@@ -307,50 +395,51 @@ class CFG:
         productions = [x
                        for x in self._productions
                        if len(x.body) != 1
-                       or not isinstance(x.body[0], Variable)]
+                       or x.body[0].kind != VARIABLE_KIND]
         productions_d = get_productions_d(productions)
         for var_a, var_b in unit_pairs:
             for production in productions_d.get(var_b, []):
                 productions.append(Production(var_a, production.body,
                                               filtering=False))
-        return CFG(self._variables,
-                   self._terminals,
-                   self._start_symbol,
-                   productions)
+        # Each variable keeps the language it generates
+        return CFG._from_internals(set(self._variables),
+                                   set(self._terminals),
+                                   self._start_symbol,
+                                   productions,
+                                   generating=self._generating_symbols,
+                                   nullable=self._nullable_symbols)
 
     def _get_productions_with_only_single_terminals(self):
         """ Remove the terminals involved in a body of length more than 1 """
-        term_to_var = dict()
-        new_productions = []
-        for terminal in self._terminals:
-            var = Variable(str(terminal.value) + "#CNF#")
-            term_to_var[terminal] = var
         # We want to add only the useful productions
-        used = set()
+        used = {symbol
+                for production in self._productions
+                if len(production.body) > 1
+                for symbol in production.body
+                if symbol.kind != VARIABLE_KIND}
+        term_to_var = {terminal: to_variable(str(terminal.value) + "#CNF#")
+                       for terminal in used}
+        new_productions = []
         for production in self._productions:
-            if len(production.body) == 1:
+            if len(production.body) <= 1:
                 new_productions.append(production)
                 continue
             new_body = []
             for symbol in production.body:
-                if symbol in term_to_var:
-                    new_body.append(term_to_var[symbol])
-                    used.add(symbol)
-                else:
-                    new_body.append(symbol)
+                var = term_to_var.get(symbol)
+                new_body.append(var if var is not None else symbol)
             new_productions.append(Production(production.head,
                                               new_body))
-        for terminal in used:
-            new_productions.append(
-                Production(term_to_var[terminal], [terminal]))
+        for terminal, var in term_to_var.items():
+            new_productions.append(Production(var, [terminal]))
         return new_productions
 
     def _get_next_free_variable(self, idx, prefix):
         idx += 1
-        temp = Variable(prefix + str(idx))
+        temp = to_variable(prefix + str(idx))
         while temp in self._variables:
             idx += 1
-            temp = Variable(prefix + str(idx))
+            temp = to_variable(prefix + str(idx))
         return idx, temp
 
     def _decompose_productions(self, productions):
@@ -358,11 +447,21 @@ class CFG:
         idx = 0
         new_productions = []
         done = dict()
+        suffix_ids = dict()
         for production in productions:
             body = production.body
             if len(body) <= 2:
                 new_productions.append(production)
                 continue
+            # Equal suffixes get the same identifier. It is built from the
+            # right with one lookup per symbol, instead of slicing and
+            # hashing each suffix
+            suffixes = [None] * len(body)
+            suffix = None
+            for i in range(len(body) - 1, 0, -1):
+                suffix = suffix_ids.setdefault((body[i], suffix),
+                                               len(suffix_ids))
+                suffixes[i] = suffix
             new_var = []
             for _ in range(len(body) - 2):
                 idx, var = self._get_next_free_variable(idx, "C#CNF#")
@@ -370,7 +469,7 @@ class CFG:
             head = production.head
             stopped = False
             for i in range(len(body) - 2):
-                temp = tuple(body[i + 1:])
+                temp = suffixes[i + 1]
                 if temp in done:
                     new_productions.append(Production(head,
                                                       [body[i], done[temp]]))
@@ -399,9 +498,15 @@ class CFG:
         the epsilon word. In that case, the language of the generated grammar \
         contains the same word as before, except the epsilon word.
 
+        The normal form is computed once and returned by the next calls, \
+        so the grammar must not be modified afterwards.
+
         """
-        if self._normal_form is not None:
-            return self._normal_form
+        if self._normal_form is None:
+            self._normal_form = self._get_normal_form()
+        return self._normal_form
+
+    def _get_normal_form(self):
         nullables = self.get_nullable_symbols()
         unit_pairs = self.get_unit_pairs()
         generating = self.get_generating_symbols()
@@ -412,23 +517,21 @@ class CFG:
                 len(reachables) !=
                 len(self._variables) + len(self._terminals)):
             if len(self._productions) == 0:
-                self._normal_form = self
                 return self
             new_cfg = self.remove_useless_symbols() \
                 .remove_epsilon() \
                 .remove_useless_symbols() \
                 .eliminate_unit_productions() \
                 .remove_useless_symbols()
-            cfg = new_cfg.to_normal_form()
-            self._normal_form = cfg
-            return cfg
+            return new_cfg.to_normal_form()
         # Remove terminals from body
         new_productions = self._get_productions_with_only_single_terminals()
         new_productions = self._decompose_productions(new_productions)
-        cfg = CFG(start_symbol=self._start_symbol,
-                  productions=set(new_productions))
-        self._normal_form = cfg
-        return cfg
+        new_cfg = CFG(start_symbol=self._start_symbol,
+                      productions=set(new_productions))
+        # The transformation leaves a grammar in normal form unchanged
+        new_cfg._normal_form = new_cfg  # pylint: disable=protected-access
+        return new_cfg
 
     @property
     def variables(self) -> AbstractSet[Variable]:
@@ -492,7 +595,7 @@ class CFG:
         new_variables_d = dict()
         new_vars = set()
         for variable in self._variables:
-            temp = Variable(variable.value + SUBS_SUFFIX + str(idx))
+            temp = to_variable(variable.value + SUBS_SUFFIX + str(idx))
             new_variables_d[variable] = temp
             new_vars.add(temp)
             idx += 1
@@ -502,34 +605,27 @@ class CFG:
         for ter, cfg in substitution.items():
             new_variables_d_local = dict()
             for variable in cfg.variables:
-                temp = Variable(variable.value + SUBS_SUFFIX + str(idx))
+                temp = to_variable(variable.value + SUBS_SUFFIX + str(idx))
                 new_variables_d_local[variable] = temp
                 new_vars.add(temp)
                 idx += 1
             # Add rules of the new cfg
-            for production in cfg.productions:
-                body = []
-                for cfgobj in production.body:
-                    if cfgobj in new_variables_d_local:
-                        body.append(new_variables_d_local[cfgobj])
-                    else:
-                        body.append(cfgobj)
-                productions.append(
-                    Production(new_variables_d_local[production.head],
-                               body))
+            productions += [
+                Production(new_variables_d_local[production.head],
+                           [new_variables_d_local.get(cfgobj, cfgobj)
+                            for cfgobj in production.body])
+                for production in cfg.productions]
             final_replacement[ter] = new_variables_d_local[cfg.start_symbol]
             terminals = terminals.union(cfg.terminals)
-        for production in self._productions:
-            body = []
-            for cfgobj in production.body:
-                if cfgobj in new_variables_d:
-                    body.append(new_variables_d[cfgobj])
-                elif cfgobj in final_replacement:
-                    body.append(final_replacement[cfgobj])
-                else:
-                    body.append(cfgobj)
-            productions.append(Production(new_variables_d[production.head],
-                                          body))
+        # The renaming of the variables has priority over the substitution
+        rename = dict(new_variables_d)
+        for ter, variable in final_replacement.items():
+            rename.setdefault(ter, variable)
+        productions += [
+            Production(new_variables_d[production.head],
+                       [rename.get(cfgobj, cfgobj)
+                        for cfgobj in production.body])
+            for production in self._productions]
         return CFG(new_vars, None, new_variables_d[self._start_symbol],
                    set(productions))
 
@@ -695,12 +791,11 @@ class CFG:
         ----------
         is_empty : bool
             Whether the CFG is empty or not
-
-        TODO
-        ----------
-        Can be optimized
         """
-        return self._start_symbol not in self.get_generating_symbols()
+        if self._generating_symbols is not None:
+            return self._start_symbol not in self._generating_symbols
+        return self._start_symbol not in self._get_generating_or_nullable(
+            False, self._start_symbol)
 
     def __bool__(self):
         return not self.is_empty()
@@ -719,7 +814,7 @@ class CFG:
             Whether word if in the CFG or not
         """
         # Remove epsilons
-        word = [to_terminal(x) for x in word if x != Epsilon()]
+        word = [to_terminal(x) for x in word if x != _EPSILON]
         if not word:
             return self.generate_epsilon()
         cyk_table = CYKTable(self, word)
@@ -740,7 +835,7 @@ class CFG:
             The parse tree
 
         """
-        word = [to_terminal(x) for x in word if x != Epsilon()]
+        word = [to_terminal(x) for x in word if x != _EPSILON]
         if not word and not self.generate_epsilon():
             raise DerivationDoesNotExist
         cyk_table = CYKTable(self, word)
@@ -757,31 +852,28 @@ class CFG:
         """
         state = pda.State("q")
         pda_object_creator = PDAObjectCreator(self._terminals, self._variables)
-        input_symbols = {pda_object_creator.get_symbol_from(x)
-                         for x in self._terminals}
-        stack_alphabet = {pda_object_creator.get_stack_symbol_from(x)
-                          for x in self._terminals.union(self._variables)}
+        symbol_of = {x: pda_object_creator.get_symbol_from(x)
+                     for x in self._terminals}
+        stack_of = {x: pda_object_creator.get_stack_symbol_from(x)
+                    for x in self._terminals}
+        stack_of.update((x, pda_object_creator.get_stack_symbol_from(x))
+                        for x in self._variables)
         start_stack_symbol = pda_object_creator.get_stack_symbol_from(
             self._start_symbol)
         new_pda = pda.PDA(states={state},
-                          input_symbols=input_symbols,
-                          stack_alphabet=stack_alphabet,
+                          input_symbols=set(symbol_of.values()),
+                          stack_alphabet=set(stack_of.values()),
                           start_state=state,
                           start_stack_symbol=start_stack_symbol)
+        epsilon = pda.Epsilon()
         for production in self._productions:
-            new_pda.add_transition(state, pda.Epsilon(),
-                                   pda_object_creator.get_stack_symbol_from(
-                                       production.head),
+            new_pda.add_transition(state, epsilon,
+                                   stack_of[production.head],
                                    state,
-                                   [pda_object_creator.get_stack_symbol_from(x)
-                                    for x in production.body])
+                                   [stack_of[x] for x in production.body])
         for terminal in self._terminals:
-            new_pda.add_transition(state,
-                                   pda_object_creator.get_symbol_from(
-                                       terminal),
-                                   pda_object_creator.get_stack_symbol_from(
-                                       terminal),
-                                   state, [])
+            new_pda.add_transition(state, symbol_of[terminal],
+                                   stack_of[terminal], state, [])
         return new_pda
 
     def intersection(self, other: Any) -> "CFG":
@@ -821,19 +913,23 @@ class CFG:
         cv_converter = \
             cvc.CFGVariableConverter(states, cfg.variables)
         new_productions = []
+        # The combined variables of each variable, shared by all the
+        # productions using it
+        combined_variables = dict()
         for production in cfg.productions:
             if len(production.body) == 2:
-                new_productions += self._intersection_when_two_non_terminals(
-                    production, states, cv_converter)
+                new_productions.extend(
+                    self._intersection_when_two_non_terminals(
+                        production, states, cv_converter, combined_variables))
             else:
-                new_productions += self._intersection_when_terminal(
+                new_productions.extend(self._intersection_when_terminal(
                     other,
                     production,
                     cv_converter,
-                    states)
-        new_productions += self._intersection_starting_rules(cfg,
-                                                             other,
-                                                             cv_converter)
+                    states))
+        new_productions.extend(self._intersection_starting_rules(cfg,
+                                                                 other,
+                                                                 cv_converter))
         start = Variable("Start")
         if generate_empty:
             new_productions.append(Production(start, []))
@@ -843,7 +939,6 @@ class CFG:
     @staticmethod
     def _intersection_starting_rules(cfg, other, cv_converter):
         start = Variable("Start")
-        productions_temp = []
         start_other = list(other.start_states)[0]  # it is deterministic
         for final_state in other.final_states:
             new_body = [
@@ -851,54 +946,50 @@ class CFG:
                     start_other,
                     cfg.start_symbol,
                     final_state)]
-            productions_temp.append(
-                Production(start, new_body, filtering=False))
-        return productions_temp
+            yield Production(start, new_body, filtering=False)
 
     @staticmethod
     def _intersection_when_terminal(other_fst, production,
                                     cv_converter, states):
-        productions_temp = []
         for state_p in states:
             next_states = other_fst(state_p, production.body[0].value)
             if next_states:
                 new_head = \
                     cv_converter.to_cfg_combined_variable(
                         state_p, production.head, next_states[0])
-                productions_temp.append(
-                    Production(new_head,
-                               [production.body[0]],
-                               filtering=False))
-        return productions_temp
+                yield Production(new_head,
+                                 [production.body[0]],
+                                 filtering=False)
 
     @staticmethod
     def _intersection_when_two_non_terminals(production, states,
-                                             cv_converter):
-        productions_temp = []
-        for state_p in states:
-            for state_r in states:
-                bodies = CFG._get_all_bodies(production,
-                                             state_p, state_r,
-                                             states, cv_converter)
-                new_head = \
-                    cv_converter.to_cfg_combined_variable(
-                        state_p, production.head, state_r)
-                productions_temp += [Production(new_head,
-                                                body,
-                                                filtering=False)
-                                     for body in bodies]
-        return productions_temp
+                                             cv_converter,
+                                             combined_variables):
+        heads, lefts, rights = [
+            CFG._get_combined_variables(variable, states, cv_converter,
+                                        combined_variables)
+            for variable in (production.head,
+                             production.body[0],
+                             production.body[1])]
+        for i_p, i_r, i_q in product(range(len(states)), repeat=3):
+            yield Production(heads[i_p][i_r],
+                             [lefts[i_p][i_q], rights[i_q][i_r]],
+                             filtering=False)
 
     @staticmethod
-    def _get_all_bodies(production, state_p, state_r, states, cv_converter):
-        return [
-            [cv_converter.to_cfg_combined_variable(state_p,
-                                                   production.body[0],
-                                                   state_q),
-             cv_converter.to_cfg_combined_variable(state_q,
-                                                   production.body[1],
-                                                   state_r)]
-            for state_q in states]
+    def _get_combined_variables(variable, states, cv_converter,
+                                combined_variables):
+        """ The combined variables of a variable for all pairs of states, \
+        indexed by the positions of the states """
+        table = combined_variables.get(variable)
+        if table is None:
+            table = [[cv_converter.to_cfg_combined_variable(state_p,
+                                                            variable,
+                                                            state_q)
+                      for state_q in states]
+                     for state_p in states]
+            combined_variables[variable] = table
+        return table
 
     def __and__(self, other):
         """ Gives the intersection of the current CFG with an other object
@@ -932,57 +1023,143 @@ class CFG:
         if max_length == 0:
             return
         cfg = self.to_normal_form()
-        productions = cfg.productions
-        gen_d = dict()
-        # Look for Epsilon Transitions
-        for production in productions:
-            if production.head not in gen_d:
-                gen_d[production.head] = [[]]
-            if len(production.body) == 2:
-                for obj in production.body:
-                    if obj not in gen_d:
-                        gen_d[obj] = [[]]
+        # pylint: disable=protected-access
+        unary_heads, unary_terminals, binary_productions = \
+            cfg._get_parallel_productions()
+        tables = self._initialize_words(
+            chain(unary_heads, *binary_productions[:3]))
         # To a single terminal
-        for production in productions:
-            body = production.body
-            if len(body) == 1:
-                if len(gen_d[production.head]) == 1:
-                    gen_d[production.head].append([])
-                if body not in gen_d[production.head][-1]:
-                    gen_d[production.head][-1].append(list(body))
-                    if production.head == cfg.start_symbol:
-                        yield list(body)
+        yield from self._add_terminal_words(
+            (unary_heads, unary_terminals), tables, cfg.start_symbol)
+        # The last length at which a symbol generates a word
+        last_length = 1 if unary_heads else 0
         # Complete what is missing
+        # A word longer than twice the last length splits into two words,
+        # one of which is longer than the last length and shorter than the
+        # word. So when no symbol generates a word of a length up to twice
+        # the last length, there is no longer word.
         current_length = 2
-        total_no_modification = 0
-        while current_length <= max_length or max_length == -1:
-            was_modified = False
-            for key in gen_d:
-                if len(gen_d[key]) != current_length:
-                    gen_d[key].append([])
-            for production in productions:
-                body = production.body
-                if len(gen_d[production.head]) != current_length + 1:
-                    gen_d[production.head].append([])
-                if len(body) != 2:
-                    continue
-                for i in range(1, current_length):
-                    j = current_length - i
-                    for left in gen_d[body[0]][i]:
-                        for right in gen_d[body[1]][j]:
-                            new_word = left + right
-                            if new_word not in gen_d[production.head][-1]:
-                                was_modified = True
-                                gen_d[production.head][-1].append(new_word)
-                                if production.head == cfg.start_symbol:
-                                    yield new_word
-            if was_modified:
-                total_no_modification = 0
-            else:
-                total_no_modification += 1
+        while (current_length <= max_length or max_length == -1) and \
+                current_length <= 2 * last_length:
+            for words in tables[0].values():
+                while len(words) <= current_length:
+                    words.append([])
+            if (yield from self._add_combined_words(
+                    binary_productions, tables, current_length)):
+                last_length = current_length
             current_length += 1
-            if total_no_modification > current_length / 2:
-                return
+
+    def _get_parallel_productions(self):
+        """ Splits the productions of a normal form into parallel lists
+
+        The normal form has no useless symbol, so all the productions can \
+        lead to words of the start symbol.
+
+        Returns
+        ----------
+        unary_heads : list of :class:`~pyformlang.cfg.Variable`
+            The heads of the productions to a single terminal
+        unary_terminals : list of :class:`~pyformlang.cfg.Terminal`
+            The terminals of these productions
+        binary_productions : tuple of lists
+            The heads, the left symbols and the right symbols of the \
+            productions with two variables, and whether their head is the \
+            start symbol
+        """
+        unary_heads, unary_terminals = [], []
+        binary_heads, binary_lefts, binary_rights = [], [], []
+        for production in self._productions:
+            body = production.body
+            if len(body) == 2:
+                binary_heads.append(production.head)
+                binary_lefts.append(body[0])
+                binary_rights.append(body[1])
+            elif len(body) == 1:
+                unary_heads.append(production.head)
+                unary_terminals.append(body[0])
+        binary_is_start = [head == self._start_symbol
+                           for head in binary_heads]
+        return unary_heads, unary_terminals, \
+            (binary_heads, binary_lefts, binary_rights, binary_is_start)
+
+    @staticmethod
+    def _initialize_words(symbols):
+        """ Creates the storage of the words generated by each symbol
+
+        The words of each length are kept as tuples, and the ones found for \
+        each symbol are also in a set to check them in constant time. The \
+        lengths, in increasing order, at which each symbol generates words \
+        are kept so that only the splits into two existing words are tried.
+        """
+        gen_d = dict()
+        seen_d = dict()
+        lengths_d = dict()
+        for symbol in symbols:
+            if symbol not in gen_d:
+                gen_d[symbol] = [[]]
+                seen_d[symbol] = set()
+                lengths_d[symbol] = []
+        return gen_d, seen_d, lengths_d
+
+    @staticmethod
+    def _add_terminal_words(unary_productions, tables, start_symbol):
+        """ Stores the words of length one and yields the ones of the start \
+        symbol """
+        gen_d, seen_d, lengths_d = tables
+        for head, terminal in zip(*unary_productions):
+            if len(gen_d[head]) == 1:
+                gen_d[head].append([])
+                lengths_d[head].append(1)
+            word = (terminal,)
+            if word not in seen_d[head]:
+                seen_d[head].add(word)
+                gen_d[head][-1].append(word)
+                if head == start_symbol:
+                    yield [terminal]
+
+    @classmethod
+    def _add_combined_words(cls, binary_productions, tables, length):
+        """ Stores the words of a given length made of two shorter words and \
+        yields the ones of the start symbol
+
+        The lists of the words of this length must already exist.
+
+        Returns
+        ----------
+        found : bool
+            Whether a symbol generates a new word of this length
+        """
+        gen_d, seen_d, lengths_d = tables
+        found = False
+        for head, left_symbol, right_symbol, is_start in zip(
+                *binary_productions):
+            head_words = gen_d[head][-1]
+            head_seen = seen_d[head]
+            for new_word in cls._combine_words(
+                    tables, left_symbol, right_symbol, length):
+                if new_word not in head_seen:
+                    if not head_words:
+                        lengths_d[head].append(length)
+                    found = True
+                    head_seen.add(new_word)
+                    head_words.append(new_word)
+                    if is_start:
+                        yield list(new_word)
+        return found
+
+    @staticmethod
+    def _combine_words(tables, left_symbol, right_symbol, length):
+        """ Yields the words of a given length made of a word of the left \
+        symbol followed by a word of the right symbol """
+        gen_d, _, lengths_d = tables
+        left_words = gen_d[left_symbol]
+        right_words = gen_d[right_symbol]
+        for i in lengths_d[left_symbol]:
+            if i >= length:
+                break
+            for left in left_words[i]:
+                for right in right_words[length - i]:
+                    yield left + right
 
     def is_finite(self) -> bool:
         """ Tests if the grammar is finite or not
@@ -993,17 +1170,36 @@ class CFG:
             Whether the grammar is finite or not
         """
         normal = self.to_normal_form()
-        di_graph = nx.DiGraph()
+        successors = dict()
         for production in normal.productions:
             body = production.body
             if len(body) == 2:
-                di_graph.add_edge(production.head, body[0])
-                di_graph.add_edge(production.head, body[1])
-        try:
-            nx.find_cycle(di_graph, orientation="original")
-        except nx.exception.NetworkXNoCycle:
-            return True
-        return False
+                successors.setdefault(production.head, []).extend(body)
+        # Iterative depth-first search, the grammar is infinite when a
+        # variable on the current path is reached again
+        on_path, done = 1, 2
+        status = dict()
+        for variable in successors:
+            if variable in status:
+                continue
+            status[variable] = on_path
+            stack = [(variable, iter(successors[variable]))]
+            while stack:
+                current, to_visit = stack[-1]
+                for next_variable in to_visit:
+                    next_status = status.get(next_variable)
+                    if next_status == on_path:
+                        return False
+                    if next_status is None:
+                        status[next_variable] = on_path
+                        stack.append((next_variable,
+                                      iter(successors.get(next_variable,
+                                                          ()))))
+                        break
+                else:
+                    status[current] = done
+                    stack.pop()
+        return True
 
     def to_text(self):
         """
@@ -1067,27 +1263,29 @@ class CFG:
         head_text = head_s.strip()
         if is_special_text(head_text):
             head_text = head_text[5:-1]
-        head = Variable(head_text)
+        head = to_variable(head_text)
         variables.add(head)
-        for sub_body in body_s.split("|"):
-            body = []
-            for body_component in sub_body.split():
-                if is_special_text(body_component):
-                    type_component = body_component[1:4]
-                    body_component = body_component[5:-1]
-                else:
-                    type_component = ""
-                if body_component[0] in string.ascii_uppercase or \
-                        type_component == "VAR":
-                    body_var = Variable(body_component)
-                    variables.add(body_var)
-                    body.append(body_var)
-                elif body_component not in EPSILON_SYMBOLS or type_component\
-                        == "TER":
-                    body_ter = Terminal(body_component)
-                    terminals.add(body_ter)
-                    body.append(body_ter)
-            productions.add(Production(head, body))
+        body = []
+        for body_component in _BODY_TOKEN.findall(body_s):
+            if body_component == "|":
+                productions.add(Production(head, body))
+                body = []
+                continue
+            if is_special_text(body_component):
+                type_component = body_component[1:4]
+                body_component = body_component[5:-1]
+            else:
+                type_component = ""
+            if "A" <= body_component[0] <= "Z" or type_component == "VAR":
+                body_var = to_variable(body_component)
+                variables.add(body_var)
+                body.append(body_var)
+            elif body_component not in EPSILON_SYMBOLS or type_component\
+                    == "TER":
+                body_ter = to_terminal(body_component)
+                terminals.add(body_ter)
+                body.append(body_ter)
+        productions.add(Production(head, body))
 
     def is_normal_form(self):
         """
@@ -2,6 +2,12 @@
 
 from typing import Any
 
+# Kinds of CFG objects, read from their kind attribute in the loops over
+# many symbols instead of calling isinstance
+VARIABLE_KIND = 0
+TERMINAL_KIND = 1
+EPSILON_KIND = 2
+
 
 class CFGObject:  # pylint: disable=too-few-public-methods
     """ An object in a CFG
@@ -14,6 +20,9 @@ class CFGObject:  # pylint: disable=too-few-public-methods
 
     __slots__ = ["_value", "_hash"]
 
+    # The kind of the object, one of the constants above
+    kind = None
+
     def __init__(self, value: Any):
         self._value = value
         self._hash = None
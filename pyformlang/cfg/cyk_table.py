@@ -19,23 +19,16 @@ class CYKTable:
     def __init__(self, cfg, word):
         self._cnf = cfg.to_normal_form()
         self._word = word
-        self._productions_d = dict()
-        self._set_productions_by_body()
+        # The index is kept by the normal form, so it is shared by all the
+        # CYK tables of a grammar
+        # pylint: disable=protected-access
+        self._productions_d = self._cnf._get_productions_by_body()
         self._cyk_table = dict()
         if not self._generates_all_terminals():
             self._cyk_table[(0, len(self._word))] = set()
         else:
             self._set_cyk_table()
 
-    def _set_productions_by_body(self):
-        # Organize productions
-        for production in self._cnf.productions:
-            temp = tuple(production.body)
-            if temp in self._productions_d:
-                self._productions_d[temp].append(production.head)
-            else:
-                self._productions_d[temp] = [production.head]
-
     def _set_cyk_table(self):
         self._initialize_cyk_table()
         self._propagate_in_cyk_table()
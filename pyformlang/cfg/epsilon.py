@@ -1,5 +1,6 @@
 """ An epsilon terminal """
 
+from .cfg_object import EPSILON_KIND
 from .terminal import Terminal
 
 
@@ -7,6 +8,8 @@ class Epsilon(Terminal):
     """ An epsilon terminal """
     # pylint: disable=too-few-public-methods
 
+    kind = EPSILON_KIND
+
     def __init__(self):
         super().__init__("epsilon")
 
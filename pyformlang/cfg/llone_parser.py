@@ -6,7 +6,11 @@ from pyformlang.cfg.cfg import NotParsableException
 from pyformlang.cfg.parse_tree import ParseTree
 from pyformlang.cfg.set_queue import SetQueue
 from pyformlang.cfg.utils import to_terminal
-from pyformlang.cfg.utils_cfg import get_productions_d
+
+# Default of the lookups which only read the sets
+_EMPTY = frozenset()
+
+_EPSILON = Epsilon()
 
 
 class LLOneParser:
@@ -28,7 +32,8 @@ class LLOneParser:
         # https://www.geeksforgeeks.org/first-set-in-syntax-analysis/
         triggers = self._get_triggers()
         first_set, to_process = self._initialize_first_set(triggers)
-        production_by_head = get_productions_d(self._cfg.productions)
+        # pylint: disable=protected-access
+        production_by_head = self._cfg._get_productions_by_head()
         while to_process:
             current = to_process.pop()
             for production in production_by_head[current]:
@@ -36,30 +41,24 @@ class LLOneParser:
                     continue
                 first_set_temp = self._get_first_set_production(production,
                                                                 first_set)
-                length_before = len(first_set.get(production.head, set()))
-                first_set[production.head] = first_set.get(
-                    production.head, set()).union(
-                        first_set_temp)
-                if len(first_set[production.head]) != length_before:
-                    for triggered in triggers.get(production.head, []):
+                first_set_head = first_set.setdefault(production.head, set())
+                length_before = len(first_set_head)
+                first_set_head |= first_set_temp
+                if len(first_set_head) != length_before:
+                    for triggered in triggers.get(production.head, _EMPTY):
                         to_process.append(triggered)
         return first_set
 
     @staticmethod
     def _get_first_set_production(production, first_set):
-        first_not_containing_epsilon = 0
         first_set_temp = set()
         for body_component in production.body:
-            first_set_temp = first_set_temp.union(
-                first_set.get(
-                    production.body[first_not_containing_epsilon],
-                    set()))
-            if Epsilon() not in first_set.get(body_component, set()):
+            first_set_component = first_set.get(body_component, _EMPTY)
+            first_set_temp |= first_set_component
+            if _EPSILON not in first_set_component:
+                # The body does not derive epsilon
+                first_set_temp.discard(_EPSILON)
                 break
-            first_not_containing_epsilon += 1
-        if first_not_containing_epsilon != len(production.body):
-            if Epsilon() in first_set_temp:
-                first_set_temp.remove(Epsilon())
         return first_set_temp
 
     def _initialize_first_set(self, triggers):
@@ -68,13 +67,13 @@ class LLOneParser:
         # Initialisation
         for terminal in self._cfg.terminals:
             first_set[terminal] = {terminal}
-            for triggered in triggers.get(terminal, []):
+            for triggered in triggers.get(terminal, _EMPTY):
                 to_process.append(triggered)
         # Generate only epsilon
         for production in self._cfg.productions:
             if not production.body:
-                first_set[production.head] = {Epsilon()}
-                for triggered in triggers.get(production.head, []):
+                first_set[production.head] = {_EPSILON}
+                for triggered in triggers.get(production.head, _EMPTY):
                     to_process.append(triggered)
         return first_set, to_process
 
@@ -82,9 +81,8 @@ class LLOneParser:
         triggers = dict()
         for production in self._cfg.productions:
             for body_component in production.body:
-                if body_component not in triggers:
-                    triggers[body_component] = []
-                triggers[body_component].append(production.head)
+                triggers.setdefault(body_component, set()).add(
+                    production.head)
         return triggers
 
     def get_follow_set(self):
@@ -94,12 +92,12 @@ class LLOneParser:
         follow_set, to_process = self._initialize_follow_set(first_set)
         while to_process:
             current = to_process.pop()
-            for triggered in triggers.get(current, set()):
-                length_before = len(follow_set.get(triggered, set()))
-                follow_set[triggered] = follow_set.get(
-                    triggered, set()
-                ).union(follow_set.get(current, set()))
-                if length_before != len(follow_set[triggered]):
+            follow_set_current = follow_set.get(current, _EMPTY)
+            for triggered in triggers.get(current, _EMPTY):
+                follow_set_triggered = follow_set.setdefault(triggered, set())
+                length_before = len(follow_set_triggered)
+                follow_set_triggered |= follow_set_current
+                if length_before != len(follow_set_triggered):
                     to_process.append(triggered)
         return follow_set
 
@@ -111,31 +109,33 @@ class LLOneParser:
         for production in self._cfg.productions:
             for i, component in enumerate(production.body):
                 for component_next in production.body[i + 1:]:
-                    follow_set[component] = follow_set.get(
-                        component, set()
-                    ).union(first_set.get(component_next, set()))
-                    if Epsilon() not in first_set.get(component_next,
-                                                      set()):
+                    first_set_next = first_set.get(component_next, _EMPTY)
+                    follow_set.setdefault(component, set()).update(
+                        first_set_next)
+                    if _EPSILON not in first_set_next:
                         break
-                if Epsilon() in follow_set.get(component, set()):
-                    follow_set[component].remove(Epsilon())
-                if follow_set.get(component, set()):
-                    to_process.append(component)
+                follow_set_component = follow_set.get(component)
+                if follow_set_component:
+                    follow_set_component.discard(_EPSILON)
+                    if follow_set_component:
+                        to_process.append(component)
         return follow_set, to_process
 
     def _get_triggers_follow_set(self, first_set):
         triggers = dict()
-        for production in self._cfg.productions:
-            if production.head not in triggers:
-                triggers[production.head] = set()
-            for i, component in enumerate(production.body):
-                all_epsilon = True
-                for component_next in production.body[i + 1:]:
-                    if Epsilon() not in first_set.get(component_next, set()):
-                        all_epsilon = False
-                        break
-                if all_epsilon:
-                    triggers[production.head].add(component)
+        # pylint: disable=protected-access
+        for head, productions in self._cfg._get_productions_by_head().items():
+            triggers_head = triggers[head] = set()
+            for production in productions:
+                for i, component in enumerate(production.body):
+                    all_epsilon = True
+                    for component_next in production.body[i + 1:]:
+                        if _EPSILON not in first_set.get(component_next,
+                                                         _EMPTY):
+                            all_epsilon = False
+                            break
+                    if all_epsilon:
+                        triggers_head.add(component)
         return triggers
 
     def get_llone_parsing_table(self):
@@ -157,7 +157,7 @@ class LLOneParser:
         for production in nullable_productions:
             if production.head not in llone_parsing_table:
                 llone_parsing_table[production.head] = dict()
-            for first in follow_set.get(production.head, set()):
+            for first in follow_set.get(production.head, _EMPTY):
                 if first not in llone_parsing_table[production.head]:
                     llone_parsing_table[production.head][first] = []
                 llone_parsing_table[production.head][first].append(
@@ -210,7 +210,7 @@ class LLOneParser:
             When the word cannot be parsed
 
         """
-        word = [to_terminal(x) for x in word if x != Epsilon()]
+        word = [to_terminal(x) for x in word if x != _EPSILON]
         word.append("$")
         word = word[::-1]
         parsing_table = self.get_llone_parsing_table()
@@ -1,6 +1,6 @@
 """ A production or rule of a CFG """
 
-from typing import List
+from typing import Iterable, Tuple
 
 from . import Terminal
 from .variable import Variable
@@ -16,16 +16,17 @@ class Production:
     head : :class:`~pyformlang.cfg.Variable`
         The head of the production
     body : iterable of :class:`~pyformlang.cfg.CFGObject`
-        The body of the production
+        The body of the production, stored as a tuple
     """
 
     __slots__ = ["_body", "_head", "_hash"]
 
-    def __init__(self, head: Variable, body: List[CFGObject], filtering=True):
+    def __init__(self, head: Variable, body: Iterable[CFGObject],
+                 filtering=True):
         if filtering:
-            self._body = [x for x in body if not isinstance(x, Epsilon)]
+            self._body = tuple(x for x in body if not isinstance(x, Epsilon))
         else:
-            self._body = body
+            self._body = tuple(body)
         self._head = head
         self._hash = None
 
@@ -35,7 +36,7 @@ class Production:
         return self._head
 
     @property
-    def body(self) -> List[CFGObject]:
+    def body(self) -> Tuple[CFGObject, ...]:
         """Get the body objects"""
         return self._body
 
@@ -44,7 +45,7 @@ class Production:
 
     def __hash__(self):
         if self._hash is None:
-            self._hash = sum(map(hash, self._body)) + hash(self._head)
+            self._hash = hash((self._head, self._body))
         return self._hash
 
     def __eq__(self, other):
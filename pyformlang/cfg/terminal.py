@@ -1,6 +1,6 @@
 """ A terminal in a CFG """
 
-from .cfg_object import CFGObject
+from .cfg_object import CFGObject, TERMINAL_KIND
 
 
 class Terminal(CFGObject):  # pylint: disable=too-few-public-methods
@@ -12,6 +12,8 @@ class Terminal(CFGObject):  # pylint: disable=too-few-public-methods
         The value of the terminal
     """
 
+    kind = TERMINAL_KIND
+
     def __eq__(self, other):
         return isinstance(other, Terminal) and self.value == other.value
 
@@ -102,6 +102,41 @@ class TestCFG(unittest.TestCase):
         self.assertEqual(len(new_cfg.productions), 1)
         self.assertFalse(cfg.is_empty())
 
+    def test_useless_removal_already_useful(self):
+        """ Test the removal of useless symbols when nothing is useless """
+        cfg = CFG.from_text("S -> a S b | A\nA -> c")
+        new_cfg = cfg.remove_useless_symbols()
+        self.assertEqual(new_cfg.variables, cfg.variables)
+        self.assertEqual(new_cfg.terminals, cfg.terminals)
+        self.assertEqual(new_cfg.productions, cfg.productions)
+        self.assertEqual(new_cfg.get_generating_symbols(),
+                         CFG(new_cfg.variables, new_cfg.terminals,
+                             new_cfg.start_symbol, new_cfg.productions)
+                         .get_generating_symbols())
+        self.assertEqual(new_cfg.get_reachable_symbols(),
+                         cfg.get_reachable_symbols())
+
+    def test_transformations_keep_symbol_sets(self):
+        """ Test the sets carried over by the transformations """
+        cfg = CFG.from_text("S -> A B | C\nA -> a A | $\nB -> b | A\n"
+                            "C -> D\nD -> E\nE -> c")
+        cfg.get_reachable_symbols()
+        cfg.get_generating_symbols()
+        for new_cfg in [cfg.remove_epsilon(),
+                        cfg.eliminate_unit_productions(),
+                        cfg.remove_useless_symbols(),
+                        cfg.remove_epsilon().eliminate_unit_productions()]:
+            recomputed = CFG(new_cfg.variables, new_cfg.terminals,
+                             new_cfg.start_symbol, new_cfg.productions)
+            self.assertEqual(new_cfg.get_generating_symbols(),
+                             recomputed.get_generating_symbols())
+            self.assertEqual(new_cfg.get_reachable_symbols(),
+                             recomputed.get_reachable_symbols())
+            self.assertEqual(new_cfg.get_nullable_symbols(),
+                             recomputed.get_nullable_symbols())
+            self.assertEqual(new_cfg.variables, recomputed.variables)
+            self.assertEqual(new_cfg.terminals, recomputed.terminals)
+
     def test_nullable_object(self):
         """ Tests the finding of nullable objects """
         var_a = Variable("A")
@@ -188,6 +223,12 @@ class TestCFG(unittest.TestCase):
         new_cfg = cfg.eliminate_unit_productions()
         self.assertEqual(len(set(new_cfg.productions)), 30)
 
+    def test_cnf_cached(self):
+        cfg = CFG.from_text("S -> a S b | A\nA -> c | $")
+        cnf = cfg.to_normal_form()
+        self.assertIs(cnf.to_normal_form(), cnf)
+        self.assertIs(cfg.to_normal_form(), cnf)
+
     def test_cnf(self):
         """ Tests the conversion to CNF form """
         # pylint: disable=too-many-locals
@@ -344,6 +385,17 @@ class TestCFG(unittest.TestCase):
         prod1 = Production(var_s, [])
         cfg = CFG({var_s}, {ter_a, ter_b}, var_s, {prod0, prod1})
         self.assertFalse(cfg.is_empty())
+        cfg = CFG.from_text("S -> a A\nA -> b | B\nB -> c B | C\nC -> d")
+        self.assertFalse(cfg.is_empty())
+        self.assertEqual(len(cfg.get_generating_symbols()), 8)
+        cfg = CFG.from_text("S -> a A\nA -> b A | B\nB -> c")
+        self.assertFalse(cfg.is_empty())
+        cfg.get_generating_symbols()
+        self.assertFalse(cfg.is_empty())
+        cfg = CFG.from_text("S -> a A\nA -> b A | B\nB -> c B")
+        self.assertTrue(cfg.is_empty())
+        cfg.get_generating_symbols()
+        self.assertTrue(cfg.is_empty())
 
     def test_membership(self):
         """ Tests the membership of a CFG """
@@ -500,6 +552,31 @@ class TestCFG(unittest.TestCase):
         self.assertIn([ter_a, ter_a], words0)
         self.assertEqual(len(words0), 3)
 
+    def test_generation_words_doubling(self):
+        """ Tests the generation of words whose lengths double """
+        cfg = CFG.from_text("S -> B B | a\nB -> C C\nC -> D D\nD -> E E\n"
+                            "E -> a")
+        words = list(cfg.get_words())
+        self.assertEqual(words, [[Terminal("a")], [Terminal("a")] * 16])
+
+    def test_generation_words_unreachable(self):
+        """ Tests the generation of words with unreachable variables """
+        cfg = CFG.from_text("S -> a S b | c\nA -> A A | a | b\nB -> S A")
+        cnf = cfg.to_normal_form()
+        self.assertEqual(cnf.get_reachable_symbols(),
+                         cnf.variables | cnf.terminals)
+        self.assertEqual([len(word) for word in cfg.get_words(5)], [1, 3, 5])
+
+    def test_generation_words_independent(self):
+        """ Tests that the generated words can be modified """
+        cfg = CFG.from_text("S -> S S | a")
+        words = []
+        for word in cfg.get_words(4):
+            words.append(list(word))
+            word.clear()
+        self.assertEqual(words, list(cfg.get_words(4)))
+        self.assertEqual(len(words), 4)
+
     def test_finite(self):
         """ Tests whether a grammar is finite or not """
         ter_a = Terminal("a")
@@ -515,6 +592,13 @@ class TestCFG(unittest.TestCase):
         prod0.add(Production(var_a, [var_s]))
         cfg = CFG(productions=prod0, start_symbol=var_s)
         self.assertFalse(cfg.is_finite())
+        # Variables shared by several branches without a cycle
+        cfg = CFG.from_text("S -> A B\nA -> C D\nB -> C D\nC -> D D\n"
+                            "D -> a")
+        self.assertTrue(cfg.is_finite())
+        cfg = CFG.from_text("S -> A B\nA -> C D\nB -> C D\nC -> D D\n"
+                            "D -> a | B b")
+        self.assertFalse(cfg.is_finite())
 
     def test_intersection(self):
         """ Tests the intersection with a regex """
@@ -617,6 +701,15 @@ class TestCFG(unittest.TestCase):
         cfg_i = cfg.intersection(dfa)
         self.assertFalse(cfg_i.is_empty())
 
+    def test_intersection_shared_symbols(self):
+        cfg0 = CFG.from_text("B -> c\nC -> d\nD -> e\nE -> f\nF -> g\n"
+                             "S -> a S b | a b | B C D E F")
+        cfg_i = cfg0 & Regex("a a b b")
+        self.assertEqual(len(list(cfg_i.get_words())), 1)
+        cfg1 = CFG.from_text("S -> x | S S")
+        cfg_i = cfg1 & Regex("x x")
+        self.assertEqual(len(list(cfg_i.get_words())), 1)
+
     def test_intersection_dfa2(self):
         state0 = State(0)
         symb_a = Symbol("a")
@@ -776,6 +869,15 @@ class TestCFG(unittest.TestCase):
         cfg = CFG.from_text(text)
         self.assertEqual(2, len(cfg.productions))
 
+    def test_from_text_union_without_spaces(self):
+        cfg = CFG.from_text("S -> a B|c\t|B|")
+        self.assertEqual(cfg.productions,
+                         {Production(Variable("S"),
+                                     [Terminal("a"), Variable("B")]),
+                          Production(Variable("S"), [Terminal("c")]),
+                          Production(Variable("S"), [Variable("B")]),
+                          Production(Variable("S"), [])})
+
     def test_epsilon(self):
         text = "S -> epsilon"
         cfg = CFG.from_text(text)
@@ -794,6 +896,20 @@ class TestCFG(unittest.TestCase):
         cfg = CFG(productions=productions, start_symbol=var_s)
         self.assertFalse(cfg.generate_epsilon())
 
+    def test_generate_epsilon_repeated(self):
+        cfg = CFG.from_text("S -> A B\nA -> a | $\nB -> A A | b")
+        self.assertTrue(cfg.generate_epsilon())
+        self.assertTrue(cfg.generate_epsilon())
+        self.assertEqual(cfg.get_nullable_symbols(),
+                         {Variable("S"), Variable("A"), Variable("B")})
+        cfg = CFG.from_text("S -> A B\nA -> a | $\nB -> A b")
+        self.assertFalse(cfg.generate_epsilon())
+        self.assertFalse(cfg.generate_epsilon())
+        self.assertEqual(cfg.get_nullable_symbols(), {Variable("A")})
+        cfg = CFG.from_text("S -> a | B\nB -> b\nC -> $")
+        self.assertFalse(cfg.generate_epsilon())
+        self.assertEqual(cfg.get_nullable_symbols(), {Variable("C")})
+
     def test_change_starting_variable(self):
         text = """S1 -> a"""
         cfg = CFG.from_text(text, start_symbol="S1")
@@ -28,3 +28,12 @@ class TestProduction(unittest.TestCase):
         self.assertNotEqual(hash(prod0), hash(prod3))
         self.assertNotEqual(hash(prod0), hash(prod4))
         self.assertIn(" -> ", str(prod0))
+
+    def test_body_is_tuple(self):
+        body = [Terminal("a"), Variable("B")]
+        prod0 = Production(Variable("S"), body)
+        prod1 = Production(Variable("S"), list(reversed(body)))
+        body.append(Terminal("c"))
+        self.assertEqual(prod0.body, (Terminal("a"), Variable("B")))
+        self.assertNotEqual(prod0, prod1)
+        self.assertNotEqual(hash(prod0), hash(prod1))
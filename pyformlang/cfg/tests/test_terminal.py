@@ -2,7 +2,8 @@
 
 import unittest
 
-from pyformlang.cfg import Terminal
+from pyformlang.cfg import Terminal, Epsilon
+from pyformlang.cfg.utils import to_terminal
 
 
 class TestTerminal(unittest.TestCase):
@@ -22,3 +23,11 @@ class TestTerminal(unittest.TestCase):
         self.assertEqual(str(terminal0), str(terminal2))
         self.assertEqual(str(terminal0), str(terminal3))
         self.assertNotEqual(str(terminal0), str(terminal1))
+
+    def test_to_terminal_interning(self):
+        terminal0 = to_terminal("a")
+        self.assertIs(terminal0, to_terminal("a"))
+        terminal1 = Terminal("a")
+        self.assertIs(terminal1, to_terminal(terminal1))
+        self.assertIsInstance(to_terminal(Epsilon()), Epsilon)
+        self.assertNotIsInstance(to_terminal("epsilon"), Epsilon)
@@ -3,6 +3,7 @@
 import unittest
 
 from pyformlang.cfg import Variable
+from pyformlang.cfg.utils import to_variable
 
 
 class TestVariable(unittest.TestCase):
@@ -22,3 +23,11 @@ class TestVariable(unittest.TestCase):
         self.assertEqual(str(variable0), str(variable2))
         self.assertEqual(str(variable0), str(variable3))
         self.assertNotEqual(str(variable0), str(variable1))
+
+    def test_to_variable_interning(self):
+        variable0 = to_variable("A")
+        self.assertIs(variable0, to_variable("A"))
+        variable1 = Variable("A")
+        self.assertIs(variable1, to_variable(variable1))
+        self.assertIsNot(to_variable(1), to_variable(True))
+        self.assertEqual(to_variable(True).value, True)
@@ -1,18 +1,37 @@
 """ Useful functions """
 
+from weakref import WeakValueDictionary
+
 from .variable import Variable
 from .terminal import Terminal
 
+# Symbols created from equal values are represented by the same object, so
+# that set and dict lookups succeed on the identity check. Given symbols are
+# returned as they are: the objects of a grammar must stay the ones used in
+# its productions.
+_VARIABLES = WeakValueDictionary()
+_TERMINALS = WeakValueDictionary()
+
+
+def _intern(table, cls, value):
+    """ Gives the representative of a CFG object """
+    key = (type(value), value)
+    cfg_object = table.get(key)
+    if cfg_object is None:
+        cfg_object = cls(value)
+        table[key] = cfg_object
+    return cfg_object
+
 
 def to_variable(given):
     """ Transformation into a variable """
     if isinstance(given, Variable):
         return given
-    return Variable(given)
+    return _intern(_VARIABLES, Variable, given)
 
 
 def to_terminal(given):
     """ Transformation into a terminal """
     if isinstance(given, Terminal):
         return given
-    return Terminal(given)
+    return _intern(_TERMINALS, Terminal, given)
@@ -1,7 +1,7 @@
 """ A variable in a CFG """
 import string
 
-from .cfg_object import CFGObject
+from .cfg_object import CFGObject, VARIABLE_KIND
 
 
 class Variable(CFGObject):  # pylint: disable=too-few-public-methods
@@ -13,6 +13,8 @@ class Variable(CFGObject):  # pylint: disable=too-few-public-methods
         The value of the variable
     """
 
+    kind = VARIABLE_KIND
+
     def __init__(self, value):
         super().__init__(value)
         self._hash = None
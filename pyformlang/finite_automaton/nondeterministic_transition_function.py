@@ -1,7 +1,6 @@
 """
 A nondeterministic transition function
 """
-import copy
 from typing import Set
 
 from .state import State
@@ -200,4 +199,7 @@ class NondeterministicTransitionFunction:
         transition_dict : dict
             The transitions as a dictionary.
         """
-        return copy.deepcopy(self._transitions)
+        # States and symbols are shared, only the containers are copied
+        return {s_from: {symb_by: set(s_to)
+                         for symb_by, s_to in transitions.items()}
+                for s_from, transitions in self._transitions.items()}
@@ -577,6 +577,8 @@ class TestEpsilonNFA(unittest.TestCase):
         self.assertIn(state0, d_enfa)
         self.assertIn(symb_a, d_enfa[state0])
         self.assertIn(state1, d_enfa[state0][symb_a])
+        d_enfa[state0][symb_a].clear()
+        self.assertIn(state1, enfa0.to_dict()[state0][symb_a])
 
     def test_len(self):
         enfa = get_enfa_example1()
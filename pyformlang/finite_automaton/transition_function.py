@@ -1,7 +1,6 @@
 """
 Representation of a transition function
 """
-import copy
 from typing import List
 
 from pyformlang.finite_automaton.epsilon import Epsilon
@@ -197,7 +196,9 @@ class TransitionFunction:
         transition_dict : dict
             The transitions as a dictionary.
         """
-        return copy.deepcopy(self._transitions)
+        # States and symbols are shared, only the containers are copied
+        return {s_from: dict(transitions)
+                for s_from, transitions in self._transitions.items()}
 
 
 class DuplicateTransitionError(Exception):
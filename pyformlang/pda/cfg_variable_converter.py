@@ -1,24 +1,30 @@
 """A CFG Variable Converter"""
 
+from itertools import count
+
 from pyformlang import cfg
 
+# Identifies the converter which set the index stored on a state or a symbol
+_CONVERTER_IDS = count()
+
 
 class CFGVariableConverter:
     """A CFG Variable Converter"""
 
     def __init__(self, states, stack_symbols):
+        self._id = next(_CONVERTER_IDS)
         self._counter = 0
         self._inverse_states_d = dict()
         self._counter_state = 0
         for self._counter_state, state in enumerate(states):
             self._inverse_states_d[state] = self._counter_state
-            state.index_cfg_converter = self._counter_state
+            state.index_cfg_converter = (self._id, self._counter_state)
         self._counter_state += 1
         self._inverse_stack_symbol_d = dict()
         self._counter_symbol = 0
         for self._counter_symbol, symbol in enumerate(stack_symbols):
             self._inverse_stack_symbol_d[symbol] = self._counter_symbol
-            symbol.index_cfg_converter = self._counter_symbol
+            symbol.index_cfg_converter = (self._id, self._counter_symbol)
         self._counter_symbol += 1
         self._conversions = [[[(False, None) for _ in range(len(states))]
                               for _ in range(len(stack_symbols))] for _ in
@@ -26,29 +32,34 @@ class CFGVariableConverter:
 
     def _get_state_index(self, state):
         """Get the state index"""
-        if state.index_cfg_converter is None:
+        # The state may have been indexed by another converter
+        if state.index_cfg_converter is None or \
+                state.index_cfg_converter[0] != self._id:
             self._set_index_state(state)
-        return state.index_cfg_converter
+        return state.index_cfg_converter[1]
 
     def _set_index_state(self, state):
         """Set the state index"""
         if state not in self._inverse_states_d:
             self._inverse_states_d[state] = self._counter_state
             self._counter_state += 1
-        state.index_cfg_converter = self._inverse_states_d[state]
+        state.index_cfg_converter = (self._id, self._inverse_states_d[state])
 
     def _get_symbol_index(self, symbol):
         """Get the symbol index"""
-        if symbol.index_cfg_converter is None:
+        # The symbol may have been indexed by another converter
+        if symbol.index_cfg_converter is None or \
+                symbol.index_cfg_converter[0] != self._id:
             self._set_index_symbol(symbol)
-        return symbol.index_cfg_converter
+        return symbol.index_cfg_converter[1]
 
     def _set_index_symbol(self, symbol):
         """ Set the symbol index """
         if symbol not in self._inverse_stack_symbol_d:
             self._inverse_stack_symbol_d[symbol] = self._counter_symbol
             self._counter_symbol += 1
-        symbol.index_cfg_converter = self._inverse_stack_symbol_d[symbol]
+        symbol.index_cfg_converter = (self._id,
+                                      self._inverse_stack_symbol_d[symbol])
 
     def to_cfg_combined_variable(self, state0, stack_symbol, state1):
         """ Conversion used in the to_pda method """
@@ -12,28 +12,32 @@ from pyformlang.cfg import CFG, Epsilon
 from pyformlang.rsa.box import Box
 
 
-def remove_repetition_of_nonterminals_from_productions(grammar_in_text: str):
-    """ Remove nonterminal repeats on the left side of the rule
-    For example:
-    grammar: S -> a S b
-             S -> a b
-    grammar after function execution: S -> a S b | a b
-    """
+def _group_productions(grammar_in_text: str):
+    """ Gives the sorted bodies of each nonterminal of a grammar, each \
+    body being kept once """
     productions = dict()
     for production in grammar_in_text.splitlines():
         if "->" not in production:
             continue
 
         head, body = production.split(" -> ")
-        if head in productions:
-            productions[head] += " | " + body
-        else:
-            productions[head] = body
+        productions.setdefault(head, set()).add(body)
 
-    grammar_new = str()
-    for nonterminal in productions:
-        grammar_new += f'{nonterminal} -> {productions[nonterminal]}\n'
-    return grammar_new[:-1]
+    return {head: sorted(bodies) for head, bodies in productions.items()}
+
+
+def remove_repetition_of_nonterminals_from_productions(grammar_in_text: str):
+    """ Remove nonterminal repeats on the left side of the rule
+    For example:
+    grammar: S -> a S b
+             S -> a b
+    grammar after function execution: S -> a S b | a b
+
+    Repeated bodies are kept once and the bodies of a nonterminal are sorted
+    """
+    return "\n".join(f'{nonterminal} -> {" | ".join(bodies)}'
+                     for nonterminal, bodies
+                     in _group_productions(grammar_in_text).items())
 
 
 class RecursiveAutomaton:
@@ -70,12 +74,12 @@ class RecursiveAutomaton:
         self._boxes = dict()
         if boxes is not None:
             for box in boxes:
-                self._boxes.update({to_symbol(box.label): box})
-                self._labels.add(box.label)
+                label = to_symbol(box.label)
+                self._boxes[label] = box
+                self._labels.add(label)
 
         for label in self._labels:
-            box = self.get_box(label)
-            if box is None:
+            if label not in self._boxes:
                 raise ValueError("RSA must have the same number of labels and DFAs")
 
     def get_box(self, label: Symbol):
@@ -174,19 +178,24 @@ class RecursiveAutomaton:
         """
 
         initial_label = to_symbol(cfg.start_symbol)
-        grammar_in_true_format = remove_repetition_of_nonterminals_from_productions(cfg.to_text())
 
         boxes = set()
         labels = set()
         notation_for_epsilon = Epsilon().to_text()
-        for production in grammar_in_true_format.splitlines():
-            head, body = production.split(" -> ")
+        # Nonterminals with the same bodies share the automaton of the
+        # bodies, each box then minimizes its own copy
+        dfa_by_body = dict()
+        for head, bodies in _group_productions(cfg.to_text()).items():
             labels.add(to_symbol(head))
 
-            if body == "":
-                body = notation_for_epsilon
+            body = " | ".join(alternative or notation_for_epsilon
+                              for alternative in bodies)
 
-            boxes.add(Box(Regex(body).to_epsilon_nfa().minimize(), to_symbol(head)))
+            dfa = dfa_by_body.get(body)
+            if dfa is None:
+                dfa = Regex(body).to_epsilon_nfa().minimize()
+                dfa_by_body[body] = dfa
+            boxes.add(Box(dfa, to_symbol(head)))
 
         return RecursiveAutomaton(labels, initial_label, boxes)
 
@@ -207,17 +216,10 @@ class RecursiveAutomaton:
         if not isinstance(other, RecursiveAutomaton):
             return False
 
-        if self._labels != other._labels:
-            return False
-
-        for label in self._labels:
-            box_1 = self.get_box(label)
-            box_2 = other.get_box(label)
-
-            if not box_1 == box_2:
-                return False
-
-        return True
+        return self._labels == other._labels and self._boxes == other._boxes
 
     def __eq__(self, other):
         return self.is_equivalent_to(other)
+
+    # add_box changes the labels, so a recursive automaton is not hashable
+    __hash__ = None
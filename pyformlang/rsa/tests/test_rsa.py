@@ -46,6 +46,8 @@ class TestRSA(unittest.TestCase):
         rsa_1 = RecursiveAutomaton({Symbol("S")}, Symbol("S"), {box})
 
         self.assertEqual(rsa_2, rsa_1)
+        with self.assertRaises(TypeError):
+            hash(rsa_1)
 
     def test_is_equivalent_to(self):
         # S -> a* b*
@@ -81,3 +83,11 @@ class TestRSA(unittest.TestCase):
 
         dfa_V = Regex("c S d | c d").to_epsilon_nfa().minimize()
         self.assertEqual(rsa1_g2.get_box(Symbol("V")), Box(dfa_V, Symbol("V")))
+
+    def test_from_cfg_with_epsilon(self):
+        # S -> a S b | epsilon
+        rsa = RecursiveAutomaton.from_cfg(CFG.from_text("S -> a S b | $"))
+        box = rsa.get_box(Symbol("S"))
+        self.assertTrue(box.dfa.accepts([]))
+        self.assertTrue(box.dfa.accepts(["a", "S", "b"]))
+        self.assertFalse(box.dfa.accepts(["a", "b"]))